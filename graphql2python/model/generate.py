@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, List, Set
+from typing import ClassVar, Dict, List, Set
 
 from graphql import GraphQLNamedType, GraphQLSchema, build_schema, lexicographic_sort_schema
 from graphql.type.introspection import TypeKind, TypeResolvers
@@ -92,7 +92,7 @@ class Generator:
     config: GraphQL2PythonModelConfig
     render: DataModelRender
 
-    DEFAULT_PYTYPE_FOR_SCALAR: str = "str"
+    DEFAULT_PYTYPE_FOR_SCALAR: ClassVar[str] = "str"
 
     def __init__(self, config: GraphQL2PythonModelConfig):
         self.config = config
@@ -112,22 +112,22 @@ class Generator:
             each_field_optional=config.options.each_field_optional,
         )
 
-    def _render_license(self) -> str:
-        result = ""
+    def _render_license(self, buf: List[str]):
+        """Render of a license header for output py file."""
 
         if self.config.license_file is not None:
             with self.config.license_file.open("r", encoding="utf8") as license_file:
                 license_file_str = license_file.read()
 
-            result += "#\n# " + "\n# ".join(license_file_str.split("\n")) + "\n#\n\n"
+            buf.append("#\n# ")
+            buf.append(license_file_str.replace("\n", "\n# "))
+            buf.append("\n#\n\n")
 
-        return result
-
-    def _render_all_header(self) -> str:
+    def _render_all_header(self, buf: List[str]):
         """Render of all header for output py file."""
 
         # GraphQLBaseModel -- an abstract class for some GraphQL object in datamodel
-        result = '__all__ = [\n    "GraphQLBaseModel",\n'
+        buf.append('__all__ = [\n    "GraphQLBaseModel",\n')
 
         type_headers: Dict[SupportTypes, str] = {
             SupportTypes.GraphQLUnionType: "unions",
@@ -146,130 +146,94 @@ class Generator:
             SupportTypes.GraphQLObjectType,
             # SupportTypes.GraphQLInputObjectType,
         ]:
-            result += f"    # {type_headers[type_name]}\n"
+            buf.append(f"    # {type_headers[type_name]}\n")
 
             for obj_name in self.type_map.type_map[type_name]:
-                result += f'    "{obj_name}",\n'
-
-        return result + "]"
-
-    def _scalars_str(self) -> str:
-        """Render all scalars."""
-
-        scalar_strings: List[str] = []
-
-        for scalar_name in self.type_map.type_map[SupportTypes.GraphQLScalarType]:
-            obj = self.type_map.types[scalar_name]
-
-            pytype = self.config.options.scalar_pytypes.get(obj.name, self.DEFAULT_PYTYPE_FOR_SCALAR)  # type: ignore
-
-            scalar_strings.append(self.render.render_scalar(obj, pytype))  # type: ignore
-
-        return "\n\n\n" + "\n\n\n".join(scalar_strings)
-
-    def _enums_str(self) -> str:
-        """Render all enums."""
-
-        enum_strings: List[str] = []
-
-        for enum_name in self.type_map.type_map[SupportTypes.GraphQLEnumType]:
-            obj = self.type_map.types[enum_name]
-
-            enum_strings.append(self.render.render_enum(obj))  # type: ignore
-
-        if len(enum_strings) == 0:
-            return ""
-
-        return "\n\n\n" + "\n\n\n".join(enum_strings)
-
-    def _unions_str(self) -> str:
-        """Render all unions."""
-
-        union_strings: List[str] = []
-
-        for union_name in self.type_map.type_map[SupportTypes.GraphQLUnionType]:
-            obj = self.type_map.types[union_name]
+                buf.append(f'    "{obj_name}",\n')
 
-            union_strings.append(self.render.render_union(obj))  # type: ignore
+        buf.append("]")
 
-        if len(union_strings) == 0:
-            return ""
+    def _render_types(self, buf: List[str]):
+        """Render all types and update_forward_refs for each interface and for each object.
 
-        return "\n\n\n" + "\n\n\n".join(union_strings)
+        The types are rendered in one traversal of the type map; update_forward_refs lines
+        are collected on the way and written after the last object.
 
-    def _interfaces_str(self) -> str:
-        """Render all unions."""
+        """
 
-        interface_strings: List[str] = []
+        forward_refs: List[str] = []
 
-        for int_name in self.type_map.type_map[SupportTypes.GraphQLInterfaceType]:
-            obj = self.type_map.types[int_name]
-
-            field_aliases = self.config.options.fields_setting.get(int_name, {})
-
-            interface_strings.append(self.render.render_interface(obj, field_aliases))  # type: ignore
-
-        if len(interface_strings) == 0:
-            return ""
-
-        return "\n\n\n" + "\n\n\n".join(interface_strings)
+        for type_name in [
+            SupportTypes.GraphQLScalarType,
+            SupportTypes.GraphQLEnumType,
+            SupportTypes.GraphQLUnionType,
+            SupportTypes.GraphQLInterfaceType,
+            SupportTypes.GraphQLObjectType,
+        ]:
+            obj_names = self.type_map.type_map[type_name]
 
-    def _objects_str(self) -> str:
-        """Render all objects."""
+            # the section separator is written even for empty scalars or objects
+            if len(obj_names) == 0 and type_name in [SupportTypes.GraphQLScalarType, SupportTypes.GraphQLObjectType]:
+                buf.append("\n\n\n")
 
-        object_strings: List[str] = []
+            for obj_name in obj_names:
+                obj = self.type_map.types[obj_name]
 
-        for obj_name in self.type_map.type_map[SupportTypes.GraphQLObjectType]:
-            obj = self.type_map.types[obj_name]
+                buf.append("\n\n\n")
 
-            field_aliases = self.config.options.fields_setting.get(obj_name, {})
+                if type_name == SupportTypes.GraphQLScalarType:
+                    pytype = self.config.options.scalar_pytypes.get(obj_name, self.DEFAULT_PYTYPE_FOR_SCALAR)
+                    buf.append(self.render.render_scalar(obj, pytype))  # type: ignore
 
-            object_strings.append(self.render.render_object(obj, field_aliases))  # type: ignore
+                elif type_name == SupportTypes.GraphQLEnumType:
+                    buf.append(self.render.render_enum(obj))  # type: ignore
 
-        return "\n\n\n" + "\n\n\n".join(object_strings)
+                elif type_name == SupportTypes.GraphQLUnionType:
+                    buf.append(self.render.render_union(obj))  # type: ignore
 
-    def _update_forward_refs(self) -> str:
-        """Render of update_forward_refs for each interface and for each object."""
+                else:
+                    field_aliases = self.config.options.fields_setting.get(obj_name, {})
 
-        result = ""
+                    if type_name == SupportTypes.GraphQLInterfaceType:
+                        buf.append(self.render.render_interface(obj, field_aliases))  # type: ignore
+                    else:
+                        buf.append(self.render.render_object(obj, field_aliases))  # type: ignore
 
-        for type_name in [
-            SupportTypes.GraphQLInterfaceType,
-            SupportTypes.GraphQLObjectType,
-        ]:
-            for o_name in self.type_map.type_map[type_name]:
-                result += f"{o_name}.update_forward_refs()\n"
+                    forward_refs.append(f"{obj_name}.update_forward_refs()\n")
 
-        if result == "":
-            return result
+        if len(forward_refs) > 0:
+            buf.append("\n\n\n")
+            buf.extend(forward_refs)
 
-        return "\n\n\n" + result
+    def generate(self) -> None:
+        # all parts of the output file are rendered to one buffer and joined once
+        buf: List[str] = []
 
-    def generate(self):
-        result_str = self._render_license()
-        result_str += '"""Auto-generated by graphql2python."""\n\n# pylint: disable-all\n# mypy: ignore-errors\n\n'
+        self._render_license(buf)
+        buf.append('"""Auto-generated by graphql2python."""\n\n# pylint: disable-all\n# mypy: ignore-errors\n\n')
 
         # TODO: add only used imports
         # TODO: add custom imports
-        result_str += """import enum
+        buf.append(
+            """import enum
 import typing as _t
 from datetime import date, datetime
 
 from pydantic import BaseModel, Field"""
+        )
 
-        result_str += "\n\n" + self._render_all_header()
+        buf.append("\n\n")
+        self._render_all_header(buf)
 
-        result_str += "\n\n\n" + self.render.render_general_class(
-            add_from_dict=self.config.options.add_from_dict,
-            add_to_dict=self.config.options.add_to_dict,
+        buf.append("\n\n\n")
+        buf.append(
+            self.render.render_general_class(
+                add_from_dict=self.config.options.add_from_dict,
+                add_to_dict=self.config.options.add_to_dict,
+            )
         )
 
-        result_str += self._scalars_str()
-        result_str += self._enums_str()
-        result_str += self._unions_str()
-        result_str += self._interfaces_str()
-        result_str += self._objects_str()
-        result_str += self._update_forward_refs()
+        self._render_types(buf)
 
         with self.config.output.open("w", encoding="utf-8") as output_file:
-            output_file.write(result_str)
+            output_file.write("".join(buf))
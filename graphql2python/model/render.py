@@ -1,19 +1,17 @@
-import os
 from keyword import iskeyword
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from graphql import (
     GraphQLEnumType,
     GraphQLField,
     GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
     GraphQLObjectType,
     GraphQLScalarType,
     GraphQLUnionType,
-    is_list_type,
     is_non_null_type,
 )
-from jinja2 import Environment, FileSystemLoader, Template
 
 from graphql2python.model.config import FieldSetting
 
@@ -22,14 +20,31 @@ __all__ = [
 ]
 
 
-# templates setting for render of classes
-TEMPLATES_FOLDER = Path(os.path.join(os.path.dirname(__file__), "templates/"))
+# indent prefixes by number of spaces, extended on demand
+_INDENT_CACHE: List[str] = ["", " ", "  ", "   ", "    "]
 
-template_env = Environment(loader=FileSystemLoader(searchpath=TEMPLATES_FOLDER))
+
+def _get_indent(size: int) -> str:
+    """Get a shared indent prefix with `size` spaces."""
+
+    if size <= 0:
+        return ""
+
+    while len(_INDENT_CACHE) <= size:
+        _INDENT_CACHE.append(" " * len(_INDENT_CACHE))
+
+    return _INDENT_CACHE[size]
+
+
+# GraphQL wrapping type --> token of this type for the field type render
+_WRAPPING_TYPE_TOKENS: Dict[type, str] = {
+    GraphQLList: "L",
+    GraphQLNonNull: "N",
+}
 
 
 class DataModelRender:
-    """Render templates for GraphQL types.
+    """Render python code for GraphQL types.
 
     Args:
         max_line_len: maximum of line length.
@@ -38,14 +53,6 @@ class DataModelRender:
 
     """
 
-    _template_comment: Template = template_env.get_template("comment.jinja2")
-    _template_docstring: Template = template_env.get_template("docstring.jinja2")
-    _template_scalar: Template = template_env.get_template("scalar.jinja2")
-    _template_enum: Template = template_env.get_template("enum.jinja2")
-    _template_union: Template = template_env.get_template("union.jinja2")
-    _template_interface: Template = template_env.get_template("interface.jinja2")
-    _template_object: Template = template_env.get_template("object.jinja2")
-
     SCALAR_DEFAULT_DESCRIPTION = "A Scalar type\nSee https://graphql.org/learn/schema/#scalar-types"
     ENUM_DEFAULT_DESCRIPTION = "An Enum type\nSee https://graphql.org/learn/schema/#enumeration-types"
     UNION_DEFAULT_DESCRIPTION = "A Union type\nSee https://graphql.org/learn/schema/#union-types"
@@ -62,9 +69,29 @@ class DataModelRender:
         self.name_suffix = name_suffix
         self.each_field_optional = each_field_optional
 
+        # rendered comments and docstrings by (lines, indent, max_line_len);
+        # the default descriptions are shared by most of the schema types
+        self._comment_cache: Dict[Tuple[Tuple[str, ...], int, int], str] = {}
+        self._docstring_cache: Dict[Tuple[Tuple[str, ...], int, int], str] = {}
+
     @staticmethod
     def _line_shift(text: str, indent: int = 4) -> str:
-        return ("\n" + " " * indent).join(text.split("\n"))
+        return text.replace("\n", "\n" + _get_indent(indent))
+
+    @staticmethod
+    def _render_class(name: str, interfaces: List[str], docstring: str, fields: List[str]) -> str:
+        """Render a pydantic class for an interface or an object."""
+
+        if len(interfaces) > 0:
+            parents = "(" + "".join(f"\n    {interface}," for interface in interfaces) + "\n)"
+        else:
+            parents = "(GraphQLBaseModel)"
+
+        return (
+            f"class {name}{parents}:\n{docstring}"
+            + "".join(f"\n{field}" for field in fields)
+            + f'\n    typename__: _t.Literal["{name}"] = Field(default="{name}", alias="__typename")'
+        )
 
     @staticmethod
     def render_general_class(add_from_dict: bool, add_to_dict: bool) -> str:
@@ -135,7 +162,7 @@ class DataModelRender:
         return line_processed
 
     def render_comment(self, lines: List[str], indent: int = 0, max_line_len: int = 120) -> str:
-        """Render multiline comment with `comment.jinja2` template.
+        """Render multiline comment.
 
         Args:
             lines: comment lines.
@@ -147,6 +174,10 @@ class DataModelRender:
         if len(lines) == 0:
             lines.append("...")
 
+        cache_key = (tuple(lines), indent, max_line_len)
+        if cache_key in self._comment_cache:
+            return self._comment_cache[cache_key]
+
         processed_lines: List[str] = []
 
         for line in lines:
@@ -155,10 +186,15 @@ class DataModelRender:
             for line_from_separated_lines in separated_lines:
                 processed_lines += self.processing_of_line(line_from_separated_lines, indent, max_line_len)
 
-        return self._template_comment.render(indent=" " * indent, lines=processed_lines)[:-1]
+        indent_str = _get_indent(indent)
+
+        result = "\n".join(f"{indent_str}# {line}" for line in processed_lines)
+        self._comment_cache[cache_key] = result
+
+        return result
 
     def render_docstring(self, lines: List[str], indent: int = 0, max_line_len: int = 120) -> str:
-        """Render multiline docstring with `docstring.jinja2` template.
+        """Render multiline docstring.
 
         Args:
             lines: comment lines.
@@ -170,6 +206,10 @@ class DataModelRender:
         if len(lines) == 0:
             lines.append("...")
 
+        cache_key = (tuple(lines), indent, max_line_len)
+        if cache_key in self._docstring_cache:
+            return self._docstring_cache[cache_key]
+
         processed_lines: List[str] = []
 
         for line in lines:
@@ -178,10 +218,17 @@ class DataModelRender:
             for line_from_separated_lines in separated_lines:
                 processed_lines += self.processing_of_line(line_from_separated_lines, indent - 2, max_line_len)
 
-        return self._template_docstring.render(indent=" " * indent, lines=processed_lines)
+        indent_str = _get_indent(indent)
+
+        result = (
+            f'{indent_str}"""\n' + "".join(f"{indent_str}{line}\n" for line in processed_lines) + f'{indent_str}"""'
+        )
+        self._docstring_cache[cache_key] = result
+
+        return result
 
     def render_scalar(self, obj: GraphQLScalarType, pytype: str) -> str:
-        """Render scalar with `scalar.jinja2` template.
+        """Render scalar.
 
         Args:
             obj: scalar object for render.
@@ -194,10 +241,10 @@ class DataModelRender:
             (obj.description or self.SCALAR_DEFAULT_DESCRIPTION).split("\n"), max_line_len=self.max_line_len
         )
 
-        return self._template_scalar.render(description=description, name=name, pytype=pytype)
+        return f"{description}\n{name} = {pytype}"
 
     def render_enum(self, obj: GraphQLEnumType) -> str:
-        """Render enum with `enum.jinja2` template.
+        """Render enum.
 
         Args:
             obj: enum object for render.
@@ -209,11 +256,8 @@ class DataModelRender:
             (obj.description or self.ENUM_DEFAULT_DESCRIPTION).split("\n"), indent=4, max_line_len=self.max_line_len
         )
 
-        #
-        # for render of values with template
-        # v_name, v, desc, dpr --> value_name, value, description, deprecation_reason
-        #
-        values: List[Tuple[str, str, Optional[str], Optional[str]]] = []
+        # each value is written to the output as soon as it is rendered
+        parts: List[str] = [f"class {name}(enum.Enum):\n{docstring}"]
 
         for value_name, value in obj.values.items():  # type: ignore
             name_suffix = ""
@@ -222,28 +266,25 @@ class DataModelRender:
             if iskeyword(value_name):
                 name_suffix = self.name_suffix
 
-            v_name = name_suffix + value_name
-
             value_from_value = value.value or value_name
             if isinstance(value_from_value, (int, float)):
                 v = str(value_from_value)  # pylint: disable=invalid-name
             else:
                 v = f'"{str(value_from_value)}"'  # pylint: disable=invalid-name
 
-            v_description = None
             if value.description is not None:
-                v_description = self.render_comment(value.description.split("\n"))
+                description = self.render_comment(value.description.split("\n"))
+                parts.append(f"\n    {description}")
 
-            v_deprecated = None
-            if value.deprecation_reason is not None:
-                v_deprecated = value.deprecation_reason
+            parts.append(f"\n    {name_suffix}{value_name} = {v}")
 
-            values.append((v_name, v, v_description, v_deprecated))
+            if value.deprecation_reason is not None:
+                parts.append(f"  # deprecation_reason: {value.deprecation_reason}")
 
-        return self._template_enum.render(docstring=docstring, name=name, values=values)
+        return "".join(parts)
 
     def render_union(self, obj: GraphQLUnionType) -> str:
-        """Render union with `union.jinja2` template.
+        """Render union.
 
         Args:
             obj: union object for render.
@@ -256,7 +297,12 @@ class DataModelRender:
         )
         types = [type_.name for type_ in obj.types]  # type: ignore
 
-        return self._template_union.render(description=description, name=name, types=types)
+        if len(types) > 1:
+            return f"{description}\n{name} = _t.Union[" + "".join(f"\n    '{type_}'," for type_ in types) + "\n]"
+
+        bound = types[0] if len(types) > 0 else ""
+
+        return f"{description}\n{name} = _t.TypeVar('{name}', bound='{bound}')"
 
     def render_field_type(self, field: GraphQLField, alias: Optional[str] = None) -> str:
         """Render a type of some GraphQL field."""
@@ -289,8 +335,10 @@ class DataModelRender:
         # result list with tokens
         res_list: List[str] = []
 
-        while is_list_type(obj) or is_non_null_type(obj):
-            if is_list_type(obj):
+        wrapping_token = _WRAPPING_TYPE_TOKENS.get(type(obj))
+
+        while wrapping_token is not None:
+            if wrapping_token == "L":
                 if (prev_token is None) or (prev_token in ["L", "OL"]):
                     res_list.append("OL")
                     prev_token = "OL"
@@ -298,10 +346,11 @@ class DataModelRender:
                     res_list.append("L")
                     prev_token = "L"
 
-            elif is_non_null_type(obj):
+            else:
                 prev_token = "N"
 
             obj = obj.of_type  # type: ignore
+            wrapping_token = _WRAPPING_TYPE_TOKENS.get(type(obj))
 
         final_name = obj.name  # type: ignore
 
@@ -422,46 +471,39 @@ class DataModelRender:
 
         return result
 
-    def render_interface(self, obj: GraphQLInterfaceType, field_aliases: Dict[str, FieldSetting]) -> str:
-        """Render an interface with `interface.jinja2` template.
+    def _render_class_fields(
+        self,
+        obj: Union[GraphQLInterfaceType, GraphQLObjectType],
+        field_aliases: Dict[str, FieldSetting],
+    ) -> List[str]:
+        """Render the own fields of an interface or an object: required fields first, then optional.
 
         Args:
-            obj: interface object for render.
-            field_aliases: aliases for the interface field.
+            obj: interface or object for render.
+            field_aliases: aliases for the fields.
 
         """
 
-        docstring = self.render_docstring(
-            indent=4, lines=[obj.description or self.INTERFACE_DEFAULT_DESCRIPTION], max_line_len=self.max_line_len
-        )
-
-        interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
-
         parents = set()
 
-        for interface in obj.interfaces:  # type: ignore
-            for f_name, _ in interface.fields.items():
-                parents.add(f_name)
+        for interface in obj.interfaces:
+            parents.update(interface.fields)
 
-        fields_optional = []
-        fields_required = []
+        # fields are split once and keep their GraphQL field for the render
+        fields_optional: List[Tuple[str, GraphQLField]] = []
+        fields_required: List[Tuple[str, GraphQLField]] = []
 
         for f_name, f in obj.fields.items():  # pylint: disable=invalid-name
             if f_name in parents:
                 continue
 
-            if is_non_null_type(f.type):
-                if self.each_field_optional:
-                    fields_optional.append(f_name)
-                else:
-                    fields_required.append(f_name)
+            if is_non_null_type(f.type) and not self.each_field_optional:
+                fields_required.append((f_name, f))
             else:
-                fields_optional.append(f_name)
-
-        field_names = fields_required + fields_optional
+                fields_optional.append((f_name, f))
 
         fields = []
-        for f_name in field_names:  # type: ignore
+        for f_name, f in fields_required + fields_optional:  # pylint: disable=invalid-name
             alias = None
             new_name = None
 
@@ -469,24 +511,30 @@ class DataModelRender:
                 alias = field_aliases[f_name].alias
                 new_name = field_aliases[f_name].new_name
 
-            fields.append(
-                self.render_field(
-                    f_name,
-                    obj.fields[f_name],  # type: ignore
-                    alias=alias,
-                    new_name=new_name,
-                )
-            )
+            fields.append(self.render_field(f_name, f, alias, new_name))
+
+        return fields
+
+    def render_interface(self, obj: GraphQLInterfaceType, field_aliases: Dict[str, FieldSetting]) -> str:
+        """Render an interface.
+
+        Args:
+            obj: interface object for render.
+            field_aliases: aliases for the interface field.
+
+        """
 
-        return self._template_interface.render(
-            docstring=docstring,
-            name=obj.name,
-            interfaces=interfaces,
-            fields=fields,
+        docstring = self.render_docstring(
+            indent=4, lines=[obj.description or self.INTERFACE_DEFAULT_DESCRIPTION], max_line_len=self.max_line_len
         )
 
+        interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
+        fields = self._render_class_fields(obj, field_aliases)
+
+        return self._render_class(obj.name, interfaces, docstring, fields)
+
     def render_object(self, obj: GraphQLObjectType, field_aliases: Dict[str, FieldSetting]) -> str:
-        """Render an object with `object.jinja2` template.
+        """Render an object.
 
         Args:
             obj: object for render.
@@ -509,50 +557,6 @@ class DataModelRender:
         )
 
         interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
+        fields = self._render_class_fields(obj, field_aliases)
 
-        parents = set()
-        for interface in obj.interfaces:  # type: ignore
-            for f_name, _ in interface.fields.items():
-                parents.add(f_name)
-
-        fields_optional = []
-        fields_required = []
-
-        for f_name, f in obj.fields.items():  # pylint: disable=invalid-name
-            if f_name in parents:
-                continue
-
-            if is_non_null_type(f.type):
-                if self.each_field_optional:
-                    fields_optional.append(f_name)
-                else:
-                    fields_required.append(f_name)
-            else:
-                fields_optional.append(f_name)
-
-        field_names = fields_required + fields_optional
-
-        fields = []
-        for f_name in field_names:
-            alias = None
-            new_name = None
-
-            if f_name in field_aliases:
-                alias = field_aliases[f_name].alias
-                new_name = field_aliases[f_name].new_name
-
-            fields.append(
-                self.render_field(
-                    f_name,
-                    obj.fields[f_name],  # type: ignore
-                    alias,
-                    new_name,
-                )
-            )
-
-        return self._template_object.render(
-            docstring=docstring,
-            name=obj.name,
-            interfaces=interfaces,
-            fields=fields,
-        )
+        return self._render_class(obj.name, interfaces, docstring, fields)
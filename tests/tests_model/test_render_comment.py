@@ -44,3 +44,14 @@ def test_render_comment_lines_long_line_ident():
     # a"""
 
     assert render.render_comment(lines, 4, 10) == result
+
+
+def test_render_comment_cache():
+    """Test that the same comment is rendered once."""
+
+    cached_render = DataModelRender()
+
+    result = cached_render.render_comment(["a", "b"], 4, 120)
+
+    assert cached_render.render_comment(["a", "b"], 4, 120) is result
+    assert cached_render.render_comment(["a", "b"], 0, 120) == "# a\n# b"
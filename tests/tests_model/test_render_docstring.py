@@ -49,3 +49,14 @@ def test_render_docstring_lines_long_line_ident():
     """'''
 
     assert render.render_docstring(lines, 4, 10) == result
+
+
+def test_render_docstring_cache():
+    """Test that the same docstring is rendered once."""
+
+    cached_render = DataModelRender()
+
+    result = cached_render.render_docstring(['a', 'b'], 4, 120)
+
+    assert cached_render.render_docstring(['a', 'b'], 4, 120) is result
+    assert cached_render.render_docstring(['a', 'b'], 0, 120) == '"""\na\nb\n"""'
@@ -2,7 +2,7 @@ from typing import List
 
 import pytest
 
-from graphql2python.model.render import DataModelRender
+from graphql2python.model.render import DataModelRender, _get_indent
 
 render = DataModelRender()
 
@@ -33,3 +33,21 @@ def test_processing_of_line(line: str, result: List[str]):
 )
 def test_processing_of_line_indent(line: str, result: List[str]):
     assert render.processing_of_line(line, 4, 10) == result
+
+
+@pytest.mark.parametrize(
+    "text, indent, result",
+    [
+        ("aa", 4, "aa"),
+        ("aa\nbb", 4, "aa\n    bb"),
+        ("aa\n\nbb", 2, "aa\n  \n  bb"),
+    ],
+)
+def test_line_shift(text: str, indent: int, result: str):
+    assert render._line_shift(text, indent) == result
+
+
+@pytest.mark.parametrize("size, result", [(-1, ""), (0, ""), (4, "    "), (10, " " * 10)])
+def test_get_indent(size: int, result: str):
+    assert _get_indent(size) == result
+    assert _get_indent(size) is _get_indent(size)